@@ -10,7 +10,7 @@ from asyncio import Lock
 
 from configurations.config import DATABASE_URL, DEBUG
 from services.router import get_route
-from prisma import Prisma
+from services.db_pool import get_prisma_pool, ping_prisma_pool, close_prisma_pool
 
 from core.intent import Intent
 from executors.expense import ExpenseExecutor
@@ -58,8 +58,6 @@ app = FastAPI(title="Expense Chatbot API", version="2.0")
 # -----------------------------
 # Prisma + Executors
 # -----------------------------
-db = Prisma()
-
 expense_executor: ExpenseExecutor | None = None
 query_executor: QueryExecutor | None = None
 conversation_executor: ConversationExecutor | None = None
@@ -101,13 +99,13 @@ async def startup():
         return
 
     try:
-        await db.connect()
+        await get_prisma_pool()
         DB_CONNECTED = True
         DB_ERROR = None
         logger.info("✅ Prisma DB connected")
 
         expense_executor = ExpenseExecutor()
-        query_executor = QueryExecutor(db)
+        query_executor = QueryExecutor()
         conversation_executor = ConversationExecutor()
 
     except Exception:
@@ -121,7 +119,7 @@ async def startup():
 async def shutdown():
     global DB_CONNECTED
     if DB_CONNECTED:
-        await db.disconnect()
+        await close_prisma_pool()
         DB_CONNECTED = False
         logger.info("✅ Prisma DB disconnected")
 
@@ -135,7 +133,12 @@ async def root():
 
 @app.get("/health")
 async def health() -> Dict[str, Any]:
-    info = {"status": "ok", "db_connected": DB_CONNECTED}
+    db_connected = DB_CONNECTED
+    if db_connected:
+        # Pings the live client; reconnects it if the connection dropped
+        db_connected = await ping_prisma_pool()
+
+    info = {"status": "ok", "db_connected": db_connected}
     if DB_ERROR:
         info["db_error"] = DB_ERROR
     return info
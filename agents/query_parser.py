@@ -237,9 +237,9 @@ async def parse_query(
     logger.info(f"[PRE_PARSE] {pre}")
 
     try:
-        llm_result = await query_parser_agent.run(
-            f"User query: {user_input}\nUser ID: {user_id}"
-        )
+        # Only the query text: user_id is injected by _reconcile and
+        # never read from LLM output, so it is pure prompt overhead.
+        llm_result = await query_parser_agent.run(f"User query: {user_input}")
         parsed = llm_result.output or {}
         logger.info("[LLM] parse successful")
     except Exception as e:
@@ -3,8 +3,9 @@ from fastapi import HTTPException
 
 from core.intent import Intent
 from executors.base import BaseExecutor
+from services.db_pool import get_prisma_pool
 from services.query_orchestrator import handle_user_query
-from services.utils import deep_serialize
+from services.utils import deep_serialize_fast
 
 
 class QueryExecutor(BaseExecutor):
@@ -13,14 +14,14 @@ class QueryExecutor(BaseExecutor):
     Executor is a TRANSPORT layer only.
     """
 
-    def __init__(self, db):
-        self.db = db
-
     async def execute(self, intent: Intent) -> dict:
         try:
+            # Resolved per request → always the live process-wide client
+            db = await get_prisma_pool()
+
             try:
                 final_answer = await wait_for(
-                    handle_user_query(intent.raw_input, intent.user_id, self.db),
+                    handle_user_query(intent.raw_input, intent.user_id, db),
                     timeout=45,
                 )
             except TimeoutError:
@@ -32,7 +33,7 @@ class QueryExecutor(BaseExecutor):
             # 🔒 DO NOT reinterpret output
             # 🔒 DO NOT normalize aggregates
             # 🔒 DO NOT inject defaults
-            data = deep_serialize(final_answer)
+            data = deep_serialize_fast(final_answer)
 
             return {
                 "type": "query",
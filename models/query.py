@@ -1,5 +1,5 @@
 # FILE: models/query.py
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from typing import Any, Dict, List, Optional, Literal
 from core.query_shape import QueryShape
 
@@ -7,6 +7,8 @@ from core.query_shape import QueryShape
 # Date Range
 # -----------------------------
 class DateRange(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     start: Optional[str] = Field(
         None, description="Start date (inclusive), ISO format YYYY-MM-DD"
     )
@@ -18,6 +20,8 @@ class DateRange(BaseModel):
 # Query Filters
 # -----------------------------
 class QueryFilters(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     category: Optional[str] = Field(None)
     subcategory: Optional[str] = Field(None)
     companions: Optional[List[str]] = Field(None)
@@ -31,6 +35,9 @@ class QueryFilters(BaseModel):
 # Query Request (Parser → Builder)
 # -----------------------------
 class QueryRequest(BaseModel):
+    # Immutable once built → safe to share (defaults, caches, tests)
+    model_config = ConfigDict(frozen=True)
+
     user_id: Any = Field(..., description="User making the query")
     filters: QueryFilters = Field(default_factory=QueryFilters)
 
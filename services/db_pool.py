@@ -0,0 +1,147 @@
+# services/db_pool.py
+"""
+Process-wide Prisma client.
+
+Prisma keeps its own connection pool behind a single client, so the
+cheapest thing we can do is make sure there is exactly ONE connected
+client per process and that every request reuses it.
+
+Guarantees:
+- Connect on first use, never per request
+- Reconnect transparently when the connection is lost
+- Bounded DB fan-out per process
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+from prisma import Prisma
+from prisma.engine.errors import EngineConnectionError, NotConnectedError
+from prisma.errors import ClientNotConnectedError
+
+# ---------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------
+logger = logging.getLogger("db_pool")
+logger.setLevel(logging.INFO)
+if not logger.handlers:
+    fh = logging.FileHandler("db_pool.log")
+    fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    logger.addHandler(fh)
+
+# ---------------------------------------------------------------------
+# Limits
+# ---------------------------------------------------------------------
+MAX_CONCURRENT_DB = 50
+WARMUP_QUERIES = 8
+
+# Failures that mean "the connection is gone", not "the query is bad"
+CONNECTION_ERRORS = (
+    EngineConnectionError,
+    NotConnectedError,
+    ClientNotConnectedError,
+    httpx.TransportError,
+)
+
+# ---------------------------------------------------------------------
+# Shared State (PROCESS-WIDE)
+# ---------------------------------------------------------------------
+_prisma: Optional[Prisma] = None
+_connect_lock = asyncio.Lock()
+_db_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DB)
+
+
+# ---------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------
+async def get_prisma_pool() -> Prisma:
+    """
+    Returns the shared, connected Prisma client.
+    Usable directly or as a FastAPI dependency.
+    """
+    global _prisma
+
+    if _prisma is not None and _prisma.is_connected():
+        return _prisma
+
+    async with _connect_lock:
+        if _prisma is None:
+            _prisma = Prisma()
+        if not _prisma.is_connected():
+            await _prisma.connect()
+            logger.info("[POOL] Prisma connected")
+
+    return _prisma
+
+
+async def ping_prisma_pool() -> bool:
+    """
+    Healthcheck. Reconnects the SAME client once if the connection was
+    dropped, so every holder of the client recovers with it.
+
+    Never raises: any failure reports False.
+    """
+    try:
+        db = await get_prisma_pool()
+    except Exception:
+        logger.exception("[POOL] Connect failed")
+        return False
+
+    try:
+        await db.query_raw("SELECT 1")
+        return True
+    except CONNECTION_ERRORS:
+        logger.warning("[POOL] Connection lost, reconnecting")
+    except Exception:
+        logger.exception("[POOL] Ping failed")
+        return False
+
+    try:
+        async with _connect_lock:
+            if db.is_connected():
+                try:
+                    await db.disconnect()
+                except Exception:
+                    pass
+            await db.connect()
+
+        await db.query_raw("SELECT 1")
+    except Exception:
+        logger.exception("[POOL] Reconnect failed")
+        return False
+
+    logger.info("[POOL] Prisma reconnected")
+    return True
+
+
+async def warm_prisma_pool(n: int = WARMUP_QUERIES) -> Prisma:
+    """
+    Connects and opens pool slots up front with N concurrent trivial
+    queries, so the first real requests don't pay connection setup.
+    """
+    db = await get_prisma_pool()
+    await asyncio.gather(*(db.query_raw("SELECT 1") for _ in range(n)))
+    logger.info(f"[POOL] Warmed with {n} connections")
+    return db
+
+
+async def close_prisma_pool() -> None:
+    global _prisma
+
+    async with _connect_lock:
+        if _prisma is not None and _prisma.is_connected():
+            await _prisma.disconnect()
+            logger.info("[POOL] Prisma disconnected")
+        _prisma = None
+
+
+@asynccontextmanager
+async def db_slot() -> AsyncIterator[None]:
+    """
+    Bounds concurrent DB work so request fan-out cannot saturate the DB.
+    """
+    async with _db_semaphore:
+        yield
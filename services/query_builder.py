@@ -11,6 +11,7 @@ Design guarantees:
 - Shape-driven execution ONLY
 """
 
+import asyncio
 import logging
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -250,8 +251,11 @@ async def run_query(prisma_db: Prisma, request: QueryRequest) -> QueryResult:
                 request.sort_by: request.sort_order or "desc"
             }
 
-        rows = await prisma_db.expense.find_many(**find_kwargs)
-        total = await prisma_db.expense.count(where=where)
+        # Rows and total are independent round-trips — overlap them
+        rows, total = await asyncio.gather(
+            prisma_db.expense.find_many(**find_kwargs),
+            prisma_db.expense.count(where=where),
+        )
 
         return QueryResult(
             rows=deep_serialize(rows),
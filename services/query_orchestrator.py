@@ -1,16 +1,20 @@
 # services/query_orchestrator.py
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 
 from fastapi import HTTPException
 from prisma import Prisma
+from pydantic import BaseModel
 
 from agents.query_parser import parse_query
 from agents.query_answer import answer_query
 
 from models.query import NLPResponse, QueryRequest, QueryResult
 from services.query_builder import run_query
+from services.db_pool import db_slot
+from services.response_cache import response_cache
 from services.query_shape_resolver import resolve_query_shape
 from services.query_validator import (
     validate_query_response,
@@ -32,6 +36,20 @@ if not logger.handlers:
     fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
     logger.addHandler(fh)
 
+LOG_PREVIEW_CHARS = 512
+
+
+def _preview(model: BaseModel, limit: int = LOG_PREVIEW_CHARS) -> str:
+    """
+    Capped JSON preview for logs.
+    Uses pydantic-core's native serializer instead of the Python repr.
+    """
+    try:
+        return model.model_dump_json()[:limit]
+    except Exception:
+        # Logging must never break the request
+        return repr(model)[:limit]
+
 
 # ---------------------------------------------------------------------
 # Core Orchestrator
@@ -54,6 +72,18 @@ async def handle_user_query(
 
     logger.info(f"[ORCH] user={user_id} | text='{user_text}'")
 
+    # -------------------------------------------------
+    # 0. RESPONSE CACHE (context-free CLARIFY only)
+    # -------------------------------------------------
+    cache_key = (
+        response_cache.key(user_id, user_text) if context is None else None
+    )
+    if cache_key is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"[CACHE] hit user={user_id}")
+            return cached
+
     try:
         # -------------------------------------------------
         # 1. PARSE → DRAFT
@@ -76,7 +106,8 @@ async def handle_user_query(
         # 4. CONSTRUCT QUERY REQUEST
         # -------------------------------------------------
         query = QueryRequest(**draft, shape=shape)
-        logger.info(f"[ORCH] Constructed QueryRequest: {query}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[ORCH] Constructed QueryRequest: %s", _preview(query))
 
         # -------------------------------------------------
         # 5. SEMANTIC COMMIT (EXECUTION AUTHORITY)
@@ -86,8 +117,8 @@ async def handle_user_query(
             f"[COMMIT] decision={decision.type} reason={decision.reason}"
         )
 
-        if decision.type == CommitDecisionType.CLARIFY:
-            return NLPResponse(
+        if decision.type is CommitDecisionType.CLARIFY:
+            response = NLPResponse(
                 user_id=user_id,
                 answer=decision.message
                 or "Could you clarify what you mean?",
@@ -97,8 +128,11 @@ async def handle_user_query(
                     "reason": decision.reason,
                 },
             )
+            if cache_key is not None:
+                response_cache.put(cache_key, response)
+            return response
 
-        if decision.type == CommitDecisionType.REJECT:
+        if decision.type is CommitDecisionType.REJECT:
             raise HTTPException(
                 status_code=400,
                 detail=decision.reason or "Query rejected",
@@ -107,8 +141,10 @@ async def handle_user_query(
         # -------------------------------------------------
         # 6. EXECUTE (DATA AUTHORITY)
         # -------------------------------------------------
-        result: QueryResult = await run_query(prisma_db, query)
-        logger.info(f"[ORCH] QueryResult: {result}")
+        async with db_slot():
+            result: QueryResult = await run_query(prisma_db, query)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[ORCH] QueryResult: %s", _preview(result))
 
         # -------------------------------------------------
         # 7. ANSWER (STRING ONLY)
@@ -131,6 +167,8 @@ async def handle_user_query(
         # -------------------------------------------------
         validate_query_response(result, response, user_text)
 
+        # Never cached: data answers go stale as soon as an expense
+        # is written, and writes happen outside this service
         return response
 
     # =====================================================
@@ -145,7 +183,7 @@ async def handle_user_query(
     except Exception as e:
         logger.exception("[ORCH][UNEXPECTED_ERROR] %s", e)
 
-        return NLPResponse(
+        return NLPResponse.model_construct(
             user_id=user_id,
             answer="Something went wrong while processing your request. Please try again.",
             context={
@@ -153,3 +191,50 @@ async def handle_user_query(
                 "source": "query_orchestrator",
             },
         )
+
+
+# ---------------------------------------------------------------------
+# Batch Orchestrator (FAN-OUT)
+# ---------------------------------------------------------------------
+async def handle_user_queries(
+    items: List[Dict[str, Any]],
+    prisma_db: Prisma,
+    max_concurrency: int = 16,
+) -> List[Union[NLPResponse, BaseException]]:
+    """
+    Runs several handle_user_query calls concurrently.
+
+    Each item holds `user_text`, `user_id` and optionally `context`.
+    Results are returned in input order; a failing item yields its
+    exception instead of failing the batch.
+
+    Identical context-free (user_id, user_text) items execute once.
+    """
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(item: Dict[str, Any]) -> NLPResponse:
+        async with sem:
+            return await handle_user_query(**item, prisma_db=prisma_db)
+
+    unique: List[Dict[str, Any]] = []
+    slots: List[int] = []
+    seen: Dict[Any, int] = {}
+
+    for item in items:
+        if item.get("context") is None:
+            key = (item["user_id"], item["user_text"])
+            if key not in seen:
+                seen[key] = len(unique)
+                unique.append(item)
+            slots.append(seen[key])
+        else:
+            slots.append(len(unique))
+            unique.append(item)
+
+    results = await asyncio.gather(
+        *(_one(item) for item in unique),
+        return_exceptions=True,
+    )
+
+    return [results[i] for i in slots]
@@ -0,0 +1,92 @@
+# services/response_cache.py
+"""
+Short-lived cache of CLARIFY responses for repeated queries.
+
+Clients re-send the same ambiguous question ("how much did I spend on
+travel?") before the user answers the clarification. A CLARIFY response
+carries no data, so it cannot go stale when expenses are written and
+can be served from memory without re-parsing.
+
+Guarantees:
+- Only data-free (CLARIFY) responses are stored — callers enforce this
+- Keys are scoped to user, normalized text and calendar day
+- Entries expire after a fixed TTL
+- Bounded size, O(1) eviction
+"""
+
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Hashable, Optional, Tuple
+
+from models.query import NLPResponse
+
+# ---------------------------------------------------------------------
+# Limits
+# ---------------------------------------------------------------------
+RESPONSE_CACHE_TTL_SECONDS = 30.0
+RESPONSE_CACHE_MAX_SIZE = 5000
+
+
+# ---------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------
+class ResponseCache:
+    def __init__(
+        self,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_size: int = RESPONSE_CACHE_MAX_SIZE,
+    ):
+        self.ttl = ttl_seconds
+        self.max_size = max_size
+        # Insertion order == expiry order (fixed TTL) → oldest first
+        self._entries: "OrderedDict[Hashable, Tuple[float, NLPResponse]]" = (
+            OrderedDict()
+        )
+
+    def key(self, user_id: str, user_text: str) -> Hashable:
+        return (
+            user_id,
+            " ".join(user_text.lower().split()),
+            date.today().isoformat(),
+        )
+
+    def get(self, key: Hashable) -> Optional[NLPResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        # Deep: hits must never share context/query with the entry
+        return response.model_copy(deep=True)
+
+    def put(self, key: Hashable, response: NLPResponse) -> None:
+        now = time.monotonic()
+
+        # Re-insert at the end so order keeps tracking expiry
+        self._entries.pop(key, None)
+        self._evict(now)
+        # Snapshot: the caller still owns (and may mutate) `response`
+        self._entries[key] = (now + self.ttl, response.model_copy(deep=True))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evict(self, now: float) -> None:
+        # Expired entries are always at the front
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at >= now:
+                break
+            self._entries.popitem(last=False)
+
+        # Still full → drop oldest insertion
+        while len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+
+
+response_cache = ResponseCache()
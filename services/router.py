@@ -1,12 +1,41 @@
 # services/router.py
 
 import os
+import re
+from collections import OrderedDict
 from types import SimpleNamespace
-from typing import Optional
+from typing import Optional, Tuple
 
 from agents.router_agent import router_agent
 
 
+# ---------------------------------------------------------------------
+# Heuristic Keyword Pattern (COMPILED ONCE, SINGLE PASS)
+#
+# Word-bounded so "address" never reads as "add"; longest alternatives
+# first so "group by" wins over "group". One named group per class so
+# the text is scanned once instead of once per class.
+# ---------------------------------------------------------------------
+_STRUCTURAL = (
+    r"group by|by category|split by|group(?:s|ed|ing)?|"
+    r"breakdowns?|distributions?"
+)
+
+_NUMERIC = (
+    r"how much|total(?:s|ed|led|ing|ling)?|sum(?:s|med|ming)?|summar\w*|"
+    r"average(?:s|d)?|averaging|avg|count(?:s|ed|ing)?|"
+    r"show(?:s|ed|n|ing)?|list(?:s|ed|ing)?"
+)
+
+_CREATE = r"spent on|add(?:s|ed|ing)?|paid|bought"
+
+_HEURISTIC_RE = re.compile(
+    rf"\b(?:(?P<structural>{_STRUCTURAL})"
+    rf"|(?P<numeric>{_NUMERIC})"
+    rf"|(?P<create>{_CREATE}))\b"
+)
+
+
 # ---------------------------------------------------------------------
 # Deterministic Heuristic Router (GUARD, NOT AUTHORITY)
 #
@@ -20,80 +49,84 @@ def _heuristic_route(user_input: str) -> Optional[int]:
     Cheap, deterministic intent guess.
     This is a GUARD, not a source of truth.
     """
-    text = user_input.lower()
-
-    # -------------------------------------------------
-    # 1. STRUCTURAL ANALYTICS (HIGHEST PRIORITY)
-    # -------------------------------------------------
-    if any(
-        kw in text
-        for kw in (
-            "group",
-            "group by",
-            "by category",
-            "breakdown",
-            "split by",
-            "distribution",
-        )
-    ):
-        return 2  # analytics / query route
-
-    # -------------------------------------------------
-    # 2. NUMERIC / ANALYTIC QUERIES
-    # -------------------------------------------------
-    if any(
-        kw in text
-        for kw in (
-            "how much",
-            "total",
-            "sum",
-            "average",
-            "avg",
-            "count",
-            "show",
-            "list",
-        )
-    ):
-        return 2  # analytics / query route
-
-    # -------------------------------------------------
-    # 3. EXPLICIT EXPENSE CREATION (VERBS ONLY)
-    # -------------------------------------------------
-    if any(
-        kw in text
-        for kw in (
-            "add",
-            "paid",
-            "bought",
-            "spent on",
-        )
-    ):
-        return 1  # expense creation route
-
-    # -------------------------------------------------
-    # Unknown / ambiguous
-    # -------------------------------------------------
-    return None
+    route = None
+
+    for match in _HEURISTIC_RE.finditer(user_input.lower()):
+        kind = match.lastgroup
+
+        # -------------------------------------------------
+        # 1. STRUCTURAL ANALYTICS (HIGHEST PRIORITY)
+        # -------------------------------------------------
+        if kind == "structural":
+            return 2  # analytics / query route
+
+        # -------------------------------------------------
+        # 2. NUMERIC / ANALYTIC QUERIES
+        # -------------------------------------------------
+        if kind == "numeric":
+            route = 2  # analytics / query route
+
+        # -------------------------------------------------
+        # 3. EXPLICIT EXPENSE CREATION (VERBS ONLY)
+        # -------------------------------------------------
+        elif route is None:
+            route = 1  # expense creation route
+
+    # Unknown / ambiguous → None
+    return route
 
 
 # ---------------------------------------------------------------------
-# Public API (DROP-IN)
+# Route Cache (LRU, RESOLVED ROUTES ONLY)
+#
+# Identical inputs resolve identically, so repeat messages skip the
+# LLM round-trip. Heuristic fallbacks after an LLM failure are NOT
+# cached — the failure is transient.
 # ---------------------------------------------------------------------
-async def get_route(user_input: str):
-    """
-    Returns an object with `.route`.
+ROUTE_CACHE_MAX_SIZE = 1024
 
-    GUARANTEES:
-    - LLM is advisory, not authoritative
-    - Deterministic guard always exists
-    - Disagreements are resolved safely
-    """
+_ROUTE_CACHE: "OrderedDict[str, SimpleNamespace]" = OrderedDict()
 
-    # -------------------------------
-    # Test mode: deterministic
-    # -------------------------------
-    if os.getenv("XPENSER_TEST_MODE") == "1":
-        return SimpleNamespace(route=2)
+
+def _route_cache_key(user_input: str) -> str:
+    return " ".join(user_input.lower().split())
+
+
+def _remember_route(key: str, result: SimpleNamespace) -> None:
+    _ROUTE_CACHE[key] = result
+    _ROUTE_CACHE.move_to_end(key)
+    if len(_ROUTE_CACHE) > ROUTE_CACHE_MAX_SIZE:
+        _ROUTE_CACHE.popitem(last=False)
+
+
+def clear_route_cache() -> None:
+    _ROUTE_CACHE.clear()
+
+
+# ---------------------------------------------------------------------
+# Test Mode (READ ONCE, NOT PER CALL)
+#
+# Deterministic query route, no LLM. The env var is read at import;
+# anything that flips it later must call refresh_test_mode().
+# ---------------------------------------------------------------------
+_TEST_MODE = os.getenv("XPENSER_TEST_MODE") == "1"
+
+# Shared, never mutated by callers (they only read `.route`)
+_QUERY_SENTINEL = SimpleNamespace(route=2)
+
+
+def refresh_test_mode() -> None:
+    global _TEST_MODE
+    _TEST_MODE = os.getenv("XPENSER_TEST_MODE") == "1"
+
+
+# ---------------------------------------------------------------------
+# Route Resolution (LLM ADVISORY + HEURISTIC GUARD)
+# ---------------------------------------------------------------------
+async def _resolve_route(user_input: str) -> Tuple[SimpleNamespace, bool]:
+    """
+    Returns (result, cacheable).
+    """
 
     heuristic = _heuristic_route(user_input)
 
@@ -103,7 +136,7 @@ async def get_route(user_input: str):
     except Exception:
         # LLM failure → fallback to heuristic
         if heuristic is not None:
-            return SimpleNamespace(route=heuristic)
+            return SimpleNamespace(route=heuristic), False
         raise
 
     # -------------------------------
@@ -116,18 +149,66 @@ async def get_route(user_input: str):
                 route=heuristic,
                 warning="router_disagreement",
                 llm_route=llm_route,
-            )
+            ), True
 
     # -------------------------------
     # Normal path
     # -------------------------------
     if llm_route is not None:
-        return SimpleNamespace(route=llm_route)
+        return SimpleNamespace(route=llm_route), True
 
     # -------------------------------
     # Last resort
     # -------------------------------
     if heuristic is not None:
-        return SimpleNamespace(route=heuristic)
+        return SimpleNamespace(route=heuristic), True
 
     raise RuntimeError("Unable to determine route safely")
+
+
+# ---------------------------------------------------------------------
+# Public API (DROP-IN)
+# ---------------------------------------------------------------------
+def get_route_sync(user_input: str) -> Optional[SimpleNamespace]:
+    """
+    Resolves a route without touching the LLM or the event loop.
+
+    Returns None when the LLM is needed (no test mode, cache miss);
+    callers then fall back to `await get_route(...)`.
+    """
+
+    # -------------------------------
+    # Test mode: deterministic
+    # -------------------------------
+    if _TEST_MODE:
+        return _QUERY_SENTINEL
+
+    key = _route_cache_key(user_input)
+    cached = _ROUTE_CACHE.get(key)
+    if cached is None:
+        return None
+
+    _ROUTE_CACHE.move_to_end(key)
+    return SimpleNamespace(**vars(cached))
+
+
+async def get_route(user_input: str):
+    """
+    Returns an object with `.route`.
+
+    GUARANTEES:
+    - LLM is advisory, not authoritative
+    - Deterministic guard always exists
+    - Disagreements are resolved safely
+    """
+
+    result = get_route_sync(user_input)
+    if result is not None:
+        return result
+
+    result, cacheable = await _resolve_route(user_input)
+    if cacheable:
+        _remember_route(_route_cache_key(user_input), result)
+        return SimpleNamespace(**vars(result))
+
+    return result
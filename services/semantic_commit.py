@@ -1,8 +1,8 @@
 # services/semantic_commit.py
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, NamedTuple
 
 from models.query import QueryRequest
 from core.query_shape import QueryShape
@@ -17,14 +17,87 @@ class CommitDecisionType(str, Enum):
     REJECT = "reject"
 
 
-@dataclass(frozen=True)
-class CommitDecision:
+class CommitDecision(NamedTuple):
     type: CommitDecisionType
     reason: Optional[str] = None
     message: Optional[str] = None
     meta: Optional[Dict[str, Any]] = None
 
 
+# ---------------------------------------------------------------------
+# Static Decisions (BUILT ONCE)
+# ---------------------------------------------------------------------
+_EXECUTE_OK = CommitDecision(type=CommitDecisionType.EXECUTE)
+
+_REJECT_MISSING_SHAPE = CommitDecision(
+    type=CommitDecisionType.REJECT,
+    reason="missing_query_shape",
+)
+
+_CLARIFY_MISSING_DATE_RANGE = CommitDecision(
+    type=CommitDecisionType.CLARIFY,
+    reason="missing_date_range",
+    message=(
+        "Do you want this calculated for a specific time period "
+        "(for example, last month or this year)?"
+    ),
+)
+
+_REJECT_GROUPED_WITHOUT_GROUP_BY = CommitDecision(
+    type=CommitDecisionType.REJECT,
+    reason="grouped_without_group_by",
+)
+
+_CLARIFY_GROUPED_WITHOUT_AGGREGATE = CommitDecision(
+    type=CommitDecisionType.CLARIFY,
+    reason="grouped_without_aggregate",
+    message=(
+        "Should I group the results by count, sum, or another metric?"
+    ),
+)
+
+
+@lru_cache(maxsize=1024)
+def _clarify_unknown_category(category: str) -> CommitDecision:
+    # Only per-input decision → memoized per category name
+    return CommitDecision(
+        type=CommitDecisionType.CLARIFY,
+        reason="unknown_category",
+        message=(
+            f"I couldn't find a category named '{category}'. "
+            "Could you clarify or choose an existing category?"
+        ),
+    )
+
+
+# ---------------------------------------------------------------------
+# Shape-Specific Safety Checks
+# Each returns a blocking decision, or None to continue.
+# ---------------------------------------------------------------------
+def _check_aggregate(query: QueryRequest) -> Optional[CommitDecision]:
+    # Aggregate without date range is ambiguous
+    if not query.filters or not query.filters.date_range:
+        return _CLARIFY_MISSING_DATE_RANGE
+    return None
+
+
+def _check_grouped(query: QueryRequest) -> Optional[CommitDecision]:
+    if not query.group_by:
+        return _REJECT_GROUPED_WITHOUT_GROUP_BY
+
+    # Grouped queries without explicit aggregate are ambiguous
+    if not query.aggregate:
+        return _CLARIFY_GROUPED_WITHOUT_AGGREGATE
+    return None
+
+
+# LIST queries are safe by default → no shape check
+_SHAPE_CHECKS = {
+    QueryShape.AGGREGATE: _check_aggregate,
+    QueryShape.GROUPED: _check_grouped,
+}
+
+
 # ---------------------------------------------------------------------
 # Semantic Commit Logic (PURE, DETERMINISTIC)
 # ---------------------------------------------------------------------
@@ -43,51 +116,25 @@ def semantic_commit(
     - No DB access
     - No inference
     - Deterministic only
+
+    Context:
+    - known_categories: set/frozenset of category names (O(1) lookup)
     """
 
     # -------------------------------------------------
     # HARD GUARARDS (should already be true)
     # -------------------------------------------------
     if query.shape is None:
-        return CommitDecision(
-            type=CommitDecisionType.REJECT,
-            reason="missing_query_shape",
-        )
-
-    # -------------------------------------------------
-    # AGGREGATE SAFETY
-    # -------------------------------------------------
-    if query.shape is QueryShape.AGGREGATE:
-        # Aggregate without date range is ambiguous
-        if not query.filters or not query.filters.date_range:
-            return CommitDecision(
-                type=CommitDecisionType.CLARIFY,
-                reason="missing_date_range",
-                message=(
-                    "Do you want this calculated for a specific time period "
-                    "(for example, last month or this year)?"
-                ),
-            )
+        return _REJECT_MISSING_SHAPE
 
     # -------------------------------------------------
-    # GROUPED SAFETY
+    # SHAPE SAFETY (AGGREGATE / GROUPED)
     # -------------------------------------------------
-    if query.shape is QueryShape.GROUPED:
-        if not query.group_by:
-            return CommitDecision(
-                type=CommitDecisionType.REJECT,
-                reason="grouped_without_group_by",
-            )
-
-        # Grouped queries without explicit aggregate are ambiguous
-        if not query.aggregate:
-            return CommitDecision(
-                type=CommitDecisionType.CLARIFY,
-                reason="grouped_without_aggregate",
-                message=(
-                    "Should I group the results by count, sum, or another metric?"
-                ),
-            )
+    check = _SHAPE_CHECKS.get(query.shape)
+    if check is not None:
+        decision = check(query)
+        if decision is not None:
+            return decision
 
     # -------------------------------------------------
     # CATEGORY SANITY (optional, context-aware)
@@ -97,22 +144,9 @@ def semantic_commit(
             context.get("known_categories") if context else None
         )
         if known_categories and query.filters.category not in known_categories:
-            return CommitDecision(
-                type=CommitDecisionType.CLARIFY,
-                reason="unknown_category",
-                message=(
-                    f"I couldn't find a category named '{query.filters.category}'. "
-                    "Could you clarify or choose an existing category?"
-                ),
-            )
-
-    # -------------------------------------------------
-    # LIST QUERIES (SAFE BY DEFAULT)
-    # -------------------------------------------------
-    if query.shape is QueryShape.LIST:
-        return CommitDecision(type=CommitDecisionType.EXECUTE)
+            return _clarify_unknown_category(query.filters.category)
 
     # -------------------------------------------------
     # DEFAULT SAFE PATH
     # -------------------------------------------------
-    return CommitDecision(type=CommitDecisionType.EXECUTE)
+    return _EXECUTE_OK
@@ -1,34 +1,93 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Dict, Tuple
+
+from pydantic_core import to_jsonable_python
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _serialize_dict(obj: dict) -> dict:
+    return {k: deep_serialize(v) for k, v in obj.items()}
+
+
+def _serialize_iterable(obj: Any) -> list:
+    return [deep_serialize(v) for v in obj]
+
+
+# Exact-type dispatch: one dict lookup covers the vast majority of nodes
+# (leaves and plain containers) without walking isinstance/hasattr checks.
+_FAST: Dict[type, Callable[[Any], Any]] = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    Decimal: float,
+    datetime: datetime.isoformat,
+    dict: _serialize_dict,
+    list: _serialize_iterable,
+    tuple: _serialize_iterable,
+    set: _serialize_iterable,
+}
+
+
+# Per-type model dumpers (model_dump, then legacy dict), resolved once
+_DUMPER_CACHE: Dict[type, Tuple[Callable[[Any], Any], ...]] = {}
+
+
+def _get_dumpers(t: type) -> Tuple[Callable[[Any], Any], ...]:
+    dumpers = _DUMPER_CACHE.get(t)
+    if dumpers is None:
+        dumpers = tuple(
+            d
+            for d in (getattr(t, "model_dump", None), getattr(t, "dict", None))
+            if callable(d)
+        )
+        _DUMPER_CACHE[t] = dumpers
+    return dumpers
+
 
 def deep_serialize(obj: Any) -> Any:
     """
     Recursively convert objects to JSON-safe primitives.
     """
+    handler = _FAST.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+
+    # Slow path: subclasses, models and arbitrary objects
     if obj is None:
         return None
     if isinstance(obj, Decimal):
         return float(obj)
     if isinstance(obj, datetime):
         return obj.isoformat()
-    if hasattr(obj, "model_dump"):
-        try:
-            return deep_serialize(obj.model_dump())
-        except Exception:
-            pass
-    if hasattr(obj, "dict") and callable(obj.dict):
+    for dump in _get_dumpers(type(obj)):
         try:
-            return deep_serialize(obj.dict())
+            return deep_serialize(dump(obj))
         except Exception:
             pass
     if isinstance(obj, dict):
-        return {k: deep_serialize(v) for k, v in obj.items()}
+        return _serialize_dict(obj)
     if isinstance(obj, (list, tuple, set)):
-        return [deep_serialize(v) for v in obj]
+        return _serialize_iterable(obj)
     if isinstance(obj, (str, int, float, bool)):
         return obj
     try:
         return deep_serialize(obj.__dict__)
     except Exception:
         return str(obj)
+
+
+def deep_serialize_fast(obj: Any) -> Any:
+    """
+    Compiled (pydantic-core) conversion to JSON-safe primitives.
+
+    Unlike deep_serialize, Decimal becomes str (pydantic JSON mode).
+    Use it for payloads whose numbers are already floats, e.g. an
+    NLPResponse built from a QueryResult.
+    """
+    return to_jsonable_python(obj, fallback=deep_serialize)
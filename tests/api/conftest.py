@@ -0,0 +1,98 @@
+# tests/api/conftest.py
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from API_LAYER.app import app as api_app
+from tests.api.helpers import (
+    MOCK_EXPENSE_RESPONSE,
+    MOCK_QUERY_RESPONSE,
+    MOCK_CONVERSATION_RESPONSE,
+    fresh,
+)
+
+
+@pytest.fixture(scope="session")
+def app():
+    return api_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """
+    One TestClient for the whole API contract suite.
+    Overrides the unified client fixture in tests/conftest.py.
+
+    Created lazily at first use (not at import) and deliberately NOT
+    entered as a context manager. The app and the real prisma package
+    are already imported by tests/conftest.py; these tests stay off the
+    DB only because the lifespan never runs, so Prisma never connects
+    and DB_CONNECTED stays False, as the DB-unavailable contract needs.
+    """
+    # API tests never touch the DB — a plain stub, not a recording mock
+    app.state.db = SimpleNamespace(connected=True)
+    return TestClient(app)
+
+
+@pytest.fixture
+def reset_counters():
+    """
+    Zeroes the global request counters for one test and restores the
+    previous values afterwards, so metric tests never bleed into others.
+    """
+    from API_LAYER.app import request_counters
+
+    snapshot = dict(request_counters)
+    request_counters.update({k: 0 for k in snapshot})
+
+    yield request_counters
+
+    request_counters.clear()
+    request_counters.update(snapshot)
+
+
+# ---------------------------------------------------------
+# API-boundary patches (one per test)
+# ---------------------------------------------------------
+@pytest.fixture
+def mock_router():
+    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_expense_exec():
+    with patch("API_LAYER.app.expense_executor", new=MagicMock()) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_query_exec():
+    with patch("API_LAYER.app.query_executor", new=MagicMock()) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_conv_exec():
+    with patch("API_LAYER.app.conversation_executor", new=MagicMock()) as m:
+        yield m
+
+
+# ---------------------------------------------------------
+# Canonical executor responses (fresh copy per test)
+# ---------------------------------------------------------
+@pytest.fixture
+def mock_expense_response():
+    return fresh(MOCK_EXPENSE_RESPONSE)
+
+
+@pytest.fixture
+def mock_query_response():
+    return fresh(MOCK_QUERY_RESPONSE)
+
+
+@pytest.fixture
+def mock_conversation_response():
+    return fresh(MOCK_CONVERSATION_RESPONSE)
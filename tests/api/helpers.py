@@ -0,0 +1,91 @@
+# tests/api/helpers.py
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+# ------------------------------------------------------------
+# Router results (read-only from the API's perspective → shared)
+# ------------------------------------------------------------
+ROUTE_EXPENSE = SimpleNamespace(route=1)
+ROUTE_QUERY = SimpleNamespace(route=2)
+ROUTE_CONV = SimpleNamespace(route=3)
+
+# ------------------------------------------------------------
+# Deep freeze / thaw (JSON-shaped data only)
+# ------------------------------------------------------------
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+# ------------------------------------------------------------
+# Canonical executor responses (contract-authoritative)
+# Deeply read-only: nested objects are mappingproxies, arrays tuples.
+# Tests get fresh copies via the mock_*_response fixtures.
+# ------------------------------------------------------------
+MOCK_EXPENSE_RESPONSE = _freeze({
+    "type": "expense",
+    "data": {
+        "amount": 200.0,
+        "category": "Food",
+        "subcategory": "Lunch",
+        "date": "2025-01-24",
+        "companions": ["friends"],
+        "paymentMethod": None,
+        "description": "Lunch with friends",
+    },
+    "message": "You had a great lunch with friends 🍽️",
+})
+
+MOCK_QUERY_RESPONSE = _freeze({
+    "type": "query",
+    "data": {
+        "rows": [
+            {
+                "amount": 200,
+                "category": "Food",
+                "date": "2025-01-01",
+            }
+        ],
+        "aggregate_result": {
+            "sum": 200,
+            "count": 1,
+        },
+    },
+    "message": "Here is what I found for your expenses.",
+})
+
+MOCK_CONVERSATION_RESPONSE = _freeze({
+    "type": "conversation",
+    "data": {
+        "conversation_type": "general",
+    },
+    "message": "Hello! I’m doing great 😊",
+})
+
+
+def fresh(response: MappingProxyType) -> dict:
+    """
+    Mutable deep copy of a canonical response.
+    """
+    return _thaw(response)
+
+
+def failing_async(exc: BaseException) -> AsyncMock:
+    """
+    Async callable that raises `exc` when awaited.
+    """
+    mock = AsyncMock()
+    mock.side_effect = exc
+    return mock
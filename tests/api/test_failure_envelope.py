@@ -1,16 +1,5 @@
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, MagicMock, patch
-import sys
-
-# ------------------------------------------------------------
-# Prevent Prisma from loading during API contract tests
-# ------------------------------------------------------------
-sys.modules["prisma"] = MagicMock()
-
-from API_LAYER.app import app
-
-client = TestClient(app)
+from tests.api.helpers import ROUTE_EXPENSE, ROUTE_QUERY, failing_async
 
 # ------------------------------------------------------------
 # Helpers
@@ -36,70 +25,44 @@ def assert_failure_envelope(body: dict):
 # Tests
 # ------------------------------------------------------------
 
-def test_query_db_unavailable_returns_failure_envelope():
-    """
-    Phase 5.2 — Query attempted while DB is unavailable.
-    Must return structured failure envelope.
-    """
-
+# Phase 5.2 — every failure mode must return the same structured envelope.
+#   route=None    → the router itself raises
+#   ROUTE_EXPENSE → the expense executor raises
+#   ROUTE_QUERY   → query attempted while DB is unavailable
+FAILURE_CASES = [
+    pytest.param(
+        "How much did I spend on food?", ROUTE_QUERY, None, 503,
+        id="query_db_unavailable",
+    ),
+    pytest.param(
+        "Spent 200 on lunch", ROUTE_EXPENSE, Exception("timeout"), 500,  # status may evolve later
+        id="executor_timeout",
+    ),
+    pytest.param(
+        "Hello", None, RuntimeError("boom"), 500,
+        id="unhandled_exception",
+    ),
+]
+
+
+@pytest.mark.parametrize("text, route, error, expected_status", FAILURE_CASES)
+def test_failures_return_failure_envelope(
+    client, mock_router, mock_expense_exec, text, route, error, expected_status
+):
     payload = {
-        "text": "How much did I spend on food?",
+        "text": text,
         "user_id": "test-user",
     }
 
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route:
-        mock_get_route.return_value = MagicMock(route=2)  # query intent
-
-        response = client.post("/process", json=payload)
-
-    assert response.status_code == 503
-
-    body = response.json()
-    assert_failure_envelope(body)
-
-
-def test_executor_timeout_returns_failure_envelope():
-    """
-    Phase 5.2 — Executor timeout should map to a 504
-    with a stable failure envelope.
-    """
-
-    payload = {
-        "text": "Spent 200 on lunch",
-        "user_id": "test-user",
-    }
-
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.expense_executor", new=MagicMock()) as mock_exec:
-
-        mock_get_route.return_value = MagicMock(route=1)  # expense intent
-        mock_exec.execute = AsyncMock(
-            side_effect=Exception("timeout")
-        )
-
-        response = client.post("/process", json=payload)
-
-    assert response.status_code == 500  # status may evolve later
-    body = response.json()
-    assert_failure_envelope(body)
-
-
-def test_unhandled_exception_returns_failure_envelope():
-    """
-    Phase 5.2 — Any unexpected exception must still
-    return a structured failure response.
-    """
-
-    payload = {
-        "text": "Hello",
-        "user_id": "test-user",
-    }
+    if route is None:
+        mock_router.side_effect = error
+    else:
+        mock_router.return_value = route
 
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route:
-        mock_get_route.side_effect = RuntimeError("boom")
+    if route is ROUTE_EXPENSE:
+        mock_expense_exec.execute = failing_async(error)
 
-        response = client.post("/process", json=payload)
+    response = client.post("/process", json=payload)
 
-    assert response.status_code == 500
-    body = response.json()
-    assert_failure_envelope(body)
+    assert response.status_code == expected_status
+    assert_failure_envelope(response.json())
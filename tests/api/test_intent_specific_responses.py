@@ -1,31 +1,11 @@
-import sys
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
 
-# Prevent Prisma from initializing
-sys.modules["prisma"] = MagicMock()
+from tests.api.helpers import ROUTE_EXPENSE, ROUTE_QUERY, ROUTE_CONV
 
-from API_LAYER.app import app
-
-client = TestClient(app)
-
-MOCK_EXPENSE_RESPONSE = {
-    "type": "expense",
-    "data": {
-        "amount": 200.0,
-        "category": "Food",
-        "subcategory": "Lunch",
-        "date": "2025-01-24",
-        "companions": ["friends"],
-        "paymentMethod": None,
-        "description": "Lunch with friends",
-    },
-    "message": "You had a great lunch with friends 🍽️",
-}
-
-
-def test_expense_intent_returns_expense_semantics():
+def test_expense_intent_returns_expense_semantics(
+    client, mock_router, mock_expense_exec, mock_expense_response
+):
     """
     Phase 5.3 — Expense Intent Semantic Test
 
@@ -41,18 +21,15 @@ def test_expense_intent_returns_expense_semantics():
         "user_id": "test-user",
     }
 
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.expense_executor", new=MagicMock()) as mock_expense_exec:
-
-        # Force router → expense
-        mock_get_route.return_value = MagicMock(route=1)
+    # Force router → expense
+    mock_router.return_value = ROUTE_EXPENSE
 
-        # Mock executor output
-        mock_expense_exec.execute = AsyncMock(
-            return_value=MOCK_EXPENSE_RESPONSE
-        )
+    # Mock executor output
+    mock_expense_exec.execute = AsyncMock(
+        return_value=mock_expense_response
+    )
 
-        response = client.post("/process", json=payload)
+    response = client.post("/process", json=payload)
 
     # -----------------------------
     # HTTP
@@ -78,29 +55,9 @@ def test_expense_intent_returns_expense_semantics():
     assert "rows" not in data
     assert "aggregate_result" not in data
 
-# -------------------------------------------------------
-# Mocked query response (canonical shape)
-# -------------------------------------------------------
-MOCK_QUERY_RESPONSE = {
-    "type": "query",
-    "data": {
-        "rows": [
-            {
-                "amount": 200,
-                "category": "Food",
-                "date": "2025-01-01",
-            }
-        ],
-        "aggregate_result": {
-            "sum": 200,
-            "count": 1,
-        },
-    },
-    "message": "Here is what I found for your expenses.",
-}
-
-
-def test_query_intent_returns_query_contract():
+def test_query_intent_returns_query_contract(
+    client, mock_router, mock_query_exec, mock_query_response
+):
     """
     Phase 5.4 — Query Intent Semantic Test
 
@@ -116,15 +73,13 @@ def test_query_intent_returns_query_contract():
         "user_id": "test-user",
     }
 
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.query_executor", new=MagicMock()) as mock_query_exec, \
-         patch("API_LAYER.app.DB_CONNECTED", new=True):
+    with patch("API_LAYER.app.DB_CONNECTED", new=True):
 
         # Force router → query
-        mock_get_route.return_value = MagicMock(route=2)
+        mock_router.return_value = ROUTE_QUERY
 
         # Fake query executor output
-        mock_query_exec.execute = AsyncMock(return_value=MOCK_QUERY_RESPONSE)
+        mock_query_exec.execute = AsyncMock(return_value=mock_query_response)
 
         response = client.post("/process", json=payload)
 
@@ -162,19 +117,9 @@ def test_query_intent_returns_query_contract():
     assert not forbidden_fields.issubset(body.keys()), (
         "Expense fields leaked into query response"
     )
-# -------------------------------------------------------
-# Mocked conversation response (canonical shape)
-# -------------------------------------------------------
-MOCK_CONVERSATION_RESPONSE = {
-    "type": "conversation",
-    "data": {
-        "conversation_type": "general",
-    },
-    "message": "Hello! I’m doing great 😊",
-}
-
-
-def test_conversation_intent_returns_conversation_semantics():
+def test_conversation_intent_returns_conversation_semantics(
+    client, mock_router, mock_conv_exec, mock_conversation_response
+):
     """
     Phase 5.5 — Conversation Intent Semantic Test
 
@@ -190,18 +135,15 @@ def test_conversation_intent_returns_conversation_semantics():
         "user_id": "test-user",
     }
 
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.conversation_executor", new=MagicMock()) as mock_conv_exec:
-
-        # Force router → conversation
-        mock_get_route.return_value = MagicMock(route=3)
+    # Force router → conversation
+    mock_router.return_value = ROUTE_CONV
 
-        # Fake conversation executor output
-        mock_conv_exec.execute = AsyncMock(
-            return_value=MOCK_CONVERSATION_RESPONSE
-        )
+    # Fake conversation executor output
+    mock_conv_exec.execute = AsyncMock(
+        return_value=mock_conversation_response
+    )
 
-        response = client.post("/process", json=payload)
+    response = client.post("/process", json=payload)
 
     # --------------------
     # HTTP Layer
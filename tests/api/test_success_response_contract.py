@@ -1,64 +1,39 @@
 # tests/api/test_success_response_contract.py
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import AsyncMock, patch
 
-# ------------------------------------------------------------
-# HARD ISOLATION: prevent heavy deps from loading
-# ------------------------------------------------------------
-sys.modules["prisma"] = MagicMock()
-
-from API_LAYER.app import app
-
-client = TestClient(app)
-
-
-# ------------------------------------------------------------
-# Canonical mock responses (contract-authoritative)
-# ------------------------------------------------------------
-MOCK_EXPENSE_RESPONSE = {
-    "type": "expense",
-    "data": {"amount": 200, "category": "Food"},
-    "message": "Expense recorded successfully",
-}
-
-MOCK_QUERY_RESPONSE = {
-    "type": "query",
-    "data": {"rows": []},
-    "message": "Here are your results",
-}
-
-MOCK_CONVERSATION_RESPONSE = {
-    "type": "conversation",
-    "data": {"conversation_type": "greeting"},
-    "message": "Hello! How can I help you?",
-}
+from tests.api.helpers import ROUTE_EXPENSE, ROUTE_QUERY, ROUTE_CONV
 
 
 @pytest.mark.parametrize(
-    "payload, mock_route, mock_response",
+    "payload, mock_route",
     [
         (
             {"text": "Spent 200 rupees on lunch", "user_id": "test-user"},
-            1,  # expense
-            MOCK_EXPENSE_RESPONSE,
+            ROUTE_EXPENSE,
         ),
         (
             {"text": "How much did I spend on food?", "user_id": "test-user"},
-            2,  # query
-            MOCK_QUERY_RESPONSE,
+            ROUTE_QUERY,
         ),
         (
             {"text": "Hello there!", "user_id": "test-user"},
-            3,  # conversation
-            MOCK_CONVERSATION_RESPONSE,
+            ROUTE_CONV,
         ),
     ],
 )
 def test_success_response_has_minimal_contract(
-    payload, mock_route, mock_response
+    client,
+    mock_router,
+    mock_expense_exec,
+    mock_query_exec,
+    mock_conv_exec,
+    mock_expense_response,
+    mock_query_response,
+    mock_conversation_response,
+    payload,
+    mock_route,
 ):
     """
     PHASE 5.1 — API Contract Test (SUCCESS PATH)
@@ -70,19 +45,15 @@ def test_success_response_has_minimal_contract(
     # --------------------------------------------------------
     # Patch routing + executors at the API boundary
     # --------------------------------------------------------
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.DB_CONNECTED",True),\
-         patch("API_LAYER.app.expense_executor", new=MagicMock()) as mock_expense_exec, \
-         patch("API_LAYER.app.query_executor", new=MagicMock()) as mock_query_exec, \
-         patch("API_LAYER.app.conversation_executor", new=MagicMock()) as mock_conv_exec:
+    with patch("API_LAYER.app.DB_CONNECTED", True):
 
         # Fake router result
-        mock_get_route.return_value = MagicMock(route=mock_route)
+        mock_router.return_value = mock_route
 
         # Fake executor responses
-        mock_expense_exec.execute = AsyncMock(return_value=MOCK_EXPENSE_RESPONSE)
-        mock_query_exec.execute = AsyncMock(return_value=MOCK_QUERY_RESPONSE)
-        mock_conv_exec.execute = AsyncMock(return_value=MOCK_CONVERSATION_RESPONSE)
+        mock_expense_exec.execute = AsyncMock(return_value=mock_expense_response)
+        mock_query_exec.execute = AsyncMock(return_value=mock_query_response)
+        mock_conv_exec.execute = AsyncMock(return_value=mock_conversation_response)
 
         # ----------------------------------------------------
         # Call API
@@ -109,6 +80,5 @@ def test_success_response_has_minimal_contract(
     assert isinstance(body["type"], str), "'type' must be a string"
     assert isinstance(body["message"], str), "'message' must be a string"
 
-    # data must be JSON-serializable
-    import json
-    json.dumps(body["data"])
+    # data was decoded from JSON, so only its shape needs checking
+    assert isinstance(body["data"], (dict, list)), "'data' must be an object or array"
@@ -1,16 +1,12 @@
-import sys
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+import pytest
+from unittest.mock import AsyncMock
 
-# Prevent Prisma startup
-sys.modules["prisma"] = MagicMock()
+from tests.api.helpers import ROUTE_EXPENSE, ROUTE_QUERY
 
-from API_LAYER.app import app
 
-client = TestClient(app)
-
-
-def test_exactly_one_executor_runs_per_request():
+def test_exactly_one_executor_runs_per_request(
+    client, mock_router, mock_expense_exec, mock_query_exec, mock_conv_exec
+):
     """
     Phase 6.1 — System Integrity
 
@@ -24,32 +20,30 @@ def test_exactly_one_executor_runs_per_request():
         "user_id": "test-user",
     }
 
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.expense_executor", new=MagicMock()) as expense_exec, \
-         patch("API_LAYER.app.query_executor", new=MagicMock()) as query_exec, \
-         patch("API_LAYER.app.conversation_executor", new=MagicMock()) as conv_exec:
+    # Force expense route
+    mock_router.return_value = ROUTE_EXPENSE
 
-        # Force expense route
-        mock_get_route.return_value = MagicMock(route=1)
-
-        expense_exec.execute = AsyncMock(
-            return_value={
-                "type": "expense",
-                "data": {},
-                "message": "ok",
-            }
-        )
+    mock_expense_exec.execute = AsyncMock(
+        return_value={
+            "type": "expense",
+            "data": {},
+            "message": "ok",
+        }
+    )
 
-        response = client.post("/process", json=payload)
+    response = client.post("/process", json=payload)
 
     assert response.status_code == 200
 
     # ✅ Exactly one executor called
-    expense_exec.execute.assert_called_once()
-    query_exec.execute.assert_not_called()
-    conv_exec.execute.assert_not_called()
-
-def test_metrics_are_internally_consistent_on_success_and_failure():
+    mock_expense_exec.execute.assert_called_once()
+    mock_query_exec.execute.assert_not_called()
+    mock_conv_exec.execute.assert_not_called()
+
+@pytest.mark.xdist_group("metrics")
+def test_metrics_are_internally_consistent_on_success_and_failure(
+    client, mock_router, mock_expense_exec, reset_counters
+):
     """
     Phase 6.2 — Metrics Integrity
 
@@ -59,55 +53,46 @@ def test_metrics_are_internally_consistent_on_success_and_failure():
     - failure increments only errors
     """
 
-    from API_LAYER.app import request_counters
-
-    # Reset metrics (IMPORTANT)
-    request_counters.update({
-        "expense": 0,
-        "query": 0,
-        "unknown": 0,
-        "total": 0,
-        "errors": 0,
-    })
+    request_counters = reset_counters
 
     # -----------------------------
     # SUCCESSFUL EXPENSE REQUEST
     # -----------------------------
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route, \
-         patch("API_LAYER.app.expense_executor", new=MagicMock()) as expense_exec:
-
-        mock_get_route.return_value = MagicMock(route=1)
-        expense_exec.execute = AsyncMock(
-            return_value={"type": "expense", "data": {}, "message": "ok"}
-        )
+    mock_router.return_value = ROUTE_EXPENSE
+    mock_expense_exec.execute = AsyncMock(
+        return_value={"type": "expense", "data": {}, "message": "ok"}
+    )
 
-        client.post("/process", json={
-            "text": "Spent 100",
-            "user_id": "test-user",
-        })
+    client.post("/process", json={
+        "text": "Spent 100",
+        "user_id": "test-user",
+    })
 
-    assert request_counters["total"] == 1
-    assert request_counters["expense"] == 1
-    assert request_counters["errors"] == 0
+    assert request_counters == {
+        "expense": 1,
+        "query": 0,
+        "unknown": 0,
+        "total": 1,
+        "errors": 0,
+    }
 
     # -----------------------------
     # FAILED QUERY REQUEST
     # -----------------------------
-    with patch("API_LAYER.app.get_route", new_callable=AsyncMock) as mock_get_route:
-
-        mock_get_route.return_value = MagicMock(route=2)  # query
-        client.post("/process", json={
-            "text": "How much did I spend?",
-            "user_id": "test-user",
-        })
-
-    assert request_counters["total"] == 2
-    assert request_counters["errors"] == 1
+    mock_router.return_value = ROUTE_QUERY  # query
+    client.post("/process", json={
+        "text": "How much did I spend?",
+        "user_id": "test-user",
+    })
 
     # No intent counters should change on failure
-    assert request_counters["expense"] == 1
-    assert request_counters["query"] == 0
-    assert request_counters["unknown"] == 0
+    assert request_counters == {
+        "expense": 1,
+        "query": 0,
+        "unknown": 0,
+        "total": 2,
+        "errors": 1,
+    }
 
     # -----------------------------
     # FINAL INVARIANT
@@ -0,0 +1,106 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from models.query import QueryResult
+from services.query_orchestrator import handle_user_query
+from services.response_cache import response_cache
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+
+# Aggregate without a date range → semantic commit CLARIFY
+CLARIFY_DRAFT = {
+    "user_id": "u1",
+    "aggregate": "sum",
+    "semantic_intents": {"aggregate": True},
+}
+
+# Plain list → semantic commit EXECUTE
+EXECUTE_DRAFT = {
+    "user_id": "u1",
+    "semantic_intents": {"list": True},
+}
+
+
+@pytest.fixture
+def pipeline():
+    """
+    Parser, DB and answer agent patched at the orchestrator boundary,
+    with an empty process-wide response cache.
+    """
+    response_cache.clear()
+    with patch(
+        "services.query_orchestrator.parse_query", new=AsyncMock()
+    ) as parse, patch(
+        "services.query_orchestrator.run_query",
+        new=AsyncMock(
+            return_value=QueryResult(rows=[{"amount": 200, "category": "Food"}])
+        ),
+    ) as run, patch(
+        "services.query_orchestrator.answer_query",
+        new=AsyncMock(return_value="Here are your food expenses."),
+    ) as answer:
+        yield parse, run, answer
+    response_cache.clear()
+
+
+def ask(loop, text, context=None):
+    return loop.run_until_complete(
+        handle_user_query(text, "u1", prisma_db=None, context=context)
+    )
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_clarify_is_served_from_cache(loop, pipeline):
+    parse, _, _ = pipeline
+    parse.return_value = CLARIFY_DRAFT
+
+    first = ask(loop, "How much did I spend on travel?")
+    second = ask(loop, "how much did I  spend on travel?")
+
+    assert parse.await_count == 1
+    assert second.context == first.context
+    assert second.context["commit_decision"] == "clarify"
+
+
+def test_executed_answers_are_never_cached(loop, pipeline):
+    parse, run, answer = pipeline
+    parse.return_value = EXECUTE_DRAFT
+
+    ask(loop, "Show my food expenses")
+    ask(loop, "Show my food expenses")
+
+    assert parse.await_count == 2
+    assert run.await_count == 2
+    assert answer.await_count == 2
+
+
+def test_calls_with_context_bypass_cache(loop, pipeline):
+    parse, _, _ = pipeline
+    parse.return_value = CLARIFY_DRAFT
+    context = {"known_categories": frozenset({"Travel"})}
+
+    ask(loop, "How much did I spend on travel?", context=context)
+    ask(loop, "How much did I spend on travel?", context=context)
+
+    assert parse.await_count == 2
+
+
+def test_cache_hits_do_not_share_state(loop, pipeline):
+    parse, _, _ = pipeline
+    parse.return_value = CLARIFY_DRAFT
+
+    first = ask(loop, "How much did I spend on travel?")
+    first.context["reason"] = "mutated"
+
+    hit = ask(loop, "How much did I spend on travel?")
+    hit.context["reason"] = "mutated again"
+
+    again = ask(loop, "How much did I spend on travel?")
+    assert again.context["reason"] == "missing_date_range"
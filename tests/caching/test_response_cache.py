@@ -0,0 +1,66 @@
+import pytest
+
+from models.query import NLPResponse
+from services.response_cache import ResponseCache
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+def make_response(answer="Do you want this for a specific time period?"):
+    return NLPResponse(
+        user_id="u1",
+        answer=answer,
+        context={"commit_decision": "clarify", "reason": "missing_date_range"},
+    )
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(ttl_seconds=30, max_size=2)
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_equivalent_text_hits_same_entry(cache):
+    cache.put(cache.key("u1", "Show my spend  this month"), make_response())
+
+    hit = cache.get(cache.key("u1", "show my spend this month"))
+
+    assert hit is not None
+    assert hit.answer == "Do you want this for a specific time period?"
+
+
+def test_entries_are_scoped_per_user(cache):
+    cache.put(cache.key("u1", "show my spend"), make_response())
+
+    assert cache.get(cache.key("u2", "show my spend")) is None
+
+
+def test_reput_refreshes_eviction_order(cache):
+    cache.put(cache.key("u1", "a"), make_response())
+    cache.put(cache.key("u1", "b"), make_response())
+    cache.put(cache.key("u1", "a"), make_response())
+
+    cache.put(cache.key("u1", "c"), make_response())
+
+    assert cache.get(cache.key("u1", "b")) is None
+    assert cache.get(cache.key("u1", "a")) is not None
+
+
+def test_expired_entries_miss():
+    cache = ResponseCache(ttl_seconds=-1)
+    key = cache.key("u1", "show my spend")
+    cache.put(key, make_response())
+
+    assert cache.get(key) is None
+
+
+def test_cache_never_exceeds_max_size(cache):
+    for text in ("a", "b", "c"):
+        cache.put(cache.key("u1", text), make_response())
+
+    assert cache.get(cache.key("u1", "a")) is None
+    assert cache.get(cache.key("u1", "c")) is not None
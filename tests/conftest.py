@@ -1,4 +1,5 @@
 # tests/conftest.py
+import asyncio
 import sys
 import os
 from pathlib import Path
@@ -6,46 +7,71 @@ from pathlib import Path
 # ---------------------------------------------------------
 # Ensure project root is on PYTHONPATH BEFORE app imports
 # ---------------------------------------------------------
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 # ---------------------------------------------------------
 # Now safe to import app + dependencies
 # ---------------------------------------------------------
 import pytest
 from fastapi.testclient import TestClient
-from prisma import Prisma
-from unittest.mock import MagicMock
 
 from API_LAYER.app import app
+from services.db_pool import warm_prisma_pool
+from services.router import refresh_test_mode
 from tests.integration.safety_check import assert_test_db
 
 
+def pytest_configure(config):
+    # Registered here so runs without pytest-xdist don't warn
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run on the same xdist worker as the group",
+    )
+
+
+@pytest.fixture(scope="session")
+def loop():
+    """
+    One event loop for the session's direct coroutine tests
+    (loop.run_until_complete) instead of asyncio.run per test.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _clear_test_mode():
+    """
+    Baseline: XPENSER_TEST_MODE unset, even if exported in the shell.
+    Fixtures that need it set it explicitly.
+    """
+    os.environ.pop("XPENSER_TEST_MODE", None)
+    refresh_test_mode()
+    yield
+
+
 @pytest.fixture(scope="session")
-def client(request):
+def client():
     """
     Unified client fixture for:
-    - api tests
     - integration tests
     - semantic tests
-    """
-
-    test_path = str(request.node.fspath)
 
-    # ---------------- API TESTS ----------------
-    if "/tests/api/" in test_path:
-        app.state.db = MagicMock()
-        return TestClient(app)
+    API tests use their own stubbed client (tests/api/conftest.py).
+    """
 
-    # ---------------- INTEGRATION + SEMANTICS ----------------
     assert_test_db()
     os.environ["XPENSER_TEST_MODE"] = "1"
+    refresh_test_mode()
 
-    db = Prisma()
-    app.state.db = db
-
+    # Lifespan connects the process-wide Prisma client exactly once;
+    # warm it before yielding so the first test doesn't pay pool fill
     with TestClient(app) as client:
+        app.state.db = client.portal.call(warm_prisma_pool)
         yield client
 
     os.environ.pop("XPENSER_TEST_MODE", None)
+    refresh_test_mode()
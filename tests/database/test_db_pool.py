@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+import pytest
+
+from services import db_pool
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+class FakePrisma:
+    """
+    Minimal stand-in for prisma.Prisma: connection state + SELECT 1.
+    """
+
+    def __init__(self):
+        self.connected = False
+        self.connect_calls = 0
+        self.disconnect_calls = 0
+        self.fail_connect = False
+        self.fail_next_query = None
+
+    def is_connected(self):
+        return self.connected
+
+    async def connect(self):
+        self.connect_calls += 1
+        if self.fail_connect:
+            raise httpx.ConnectError("engine unreachable")
+        self.connected = True
+
+    async def disconnect(self):
+        self.disconnect_calls += 1
+        self.connected = False
+
+    async def query_raw(self, sql):
+        if self.fail_next_query is not None:
+            exc, self.fail_next_query = self.fail_next_query, None
+            raise exc
+        return [{"?column?": 1}]
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """
+    Fresh process-wide state backed by FakePrisma.
+    """
+    monkeypatch.setattr(db_pool, "Prisma", FakePrisma)
+    monkeypatch.setattr(db_pool, "_prisma", None)
+    monkeypatch.setattr(db_pool, "_connect_lock", asyncio.Lock())
+    return db_pool
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_connects_on_first_use_only(loop, pool):
+    first = loop.run_until_complete(pool.get_prisma_pool())
+    second = loop.run_until_complete(pool.get_prisma_pool())
+
+    assert first is second
+    assert first.connected
+    assert first.connect_calls == 1
+
+
+def test_ping_reconnects_the_same_client(loop, pool):
+    db = loop.run_until_complete(pool.get_prisma_pool())
+    db.fail_next_query = httpx.ConnectError("connection reset")
+
+    assert loop.run_until_complete(pool.ping_prisma_pool()) is True
+
+    # Same instance recovered → every holder sees the live connection
+    assert pool._prisma is db
+    assert db.connected
+    assert db.connect_calls == 2
+
+
+def test_failed_reconnect_reports_false_on_every_ping(loop, pool):
+    db = loop.run_until_complete(pool.get_prisma_pool())
+    db.fail_next_query = httpx.ConnectError("connection reset")
+    db.fail_connect = True
+
+    assert loop.run_until_complete(pool.ping_prisma_pool()) is False
+    assert not db.connected
+
+    # Next ping reconnects via get_prisma_pool, which raises → still False
+    assert loop.run_until_complete(pool.ping_prisma_pool()) is False
+
+    # Engine back → ping recovers the same client
+    db.fail_connect = False
+    assert loop.run_until_complete(pool.ping_prisma_pool()) is True
+    assert pool._prisma is db
+
+
+def test_ping_reports_false_on_non_connection_errors(loop, pool):
+    db = loop.run_until_complete(pool.get_prisma_pool())
+    db.fail_next_query = RuntimeError("query engine panic")
+
+    assert loop.run_until_complete(pool.ping_prisma_pool()) is False
+
+
+def test_close_disconnects_and_forgets_the_client(loop, pool):
+    db = loop.run_until_complete(pool.get_prisma_pool())
+
+    loop.run_until_complete(pool.close_prisma_pool())
+
+    assert db.disconnect_calls == 1
+    assert pool._prisma is None
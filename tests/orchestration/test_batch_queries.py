@@ -0,0 +1,72 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.query_orchestrator import handle_user_queries
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+
+async def _echo(user_text, user_id, prisma_db, context=None):
+    # Stand-in for handle_user_query: result identifies its input
+    await asyncio.sleep(0)
+    if user_text == "boom":
+        raise RuntimeError("boom")
+    return f"{user_id}:{user_text}"
+
+
+@pytest.fixture
+def single_query():
+    with patch(
+        "services.query_orchestrator.handle_user_query",
+        new=AsyncMock(side_effect=_echo),
+    ) as mock:
+        yield mock
+
+
+def item(text, user_id="u1", context=None):
+    return {"user_text": text, "user_id": user_id, "context": context}
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_results_come_back_in_input_order(loop, single_query):
+    items = [item("a"), item("b", user_id="u2"), item("c")]
+
+    results = loop.run_until_complete(handle_user_queries(items, prisma_db=None))
+
+    assert results == ["u1:a", "u2:b", "u1:c"]
+
+
+def test_duplicate_context_free_items_run_once(loop, single_query):
+    items = [item("a"), item("b"), item("a")]
+
+    results = loop.run_until_complete(handle_user_queries(items, prisma_db=None))
+
+    assert results == ["u1:a", "u1:b", "u1:a"]
+    assert single_query.await_count == 2
+
+
+def test_items_with_context_are_not_deduped(loop, single_query):
+    ctx = {"known_categories": frozenset({"Food"})}
+    items = [item("a", context=ctx), item("a", context=ctx)]
+
+    results = loop.run_until_complete(handle_user_queries(items, prisma_db=None))
+
+    assert results == ["u1:a", "u1:a"]
+    assert single_query.await_count == 2
+
+
+def test_failing_item_returns_its_exception(loop, single_query):
+    items = [item("a"), item("boom"), item("c")]
+
+    results = loop.run_until_complete(handle_user_queries(items, prisma_db=None))
+
+    assert results[0] == "u1:a"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == "u1:c"
@@ -1,10 +1,24 @@
+import json
+
+# ---------------------------------------------------------------------
+# Request bodies (serialized once at import)
+# ---------------------------------------------------------------------
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _body(text: str) -> bytes:
+    return json.dumps({"text": text, "user_id": "u1"}).encode()
+
+
+_BODY_LIST_AND_AGG = _body("Show my expenses and how much I spent")
+_BODY_GROUP_WITHOUT_AGG = _body("Show expenses grouped by category")
+_BODY_AGG_WITH_COLUMNS = _body("How much did I spend, show category and date")
+_BODY_SIMPLE_AGG = _body("How much did I spend on food?")
+
+
 def test_reject_list_and_aggregate_together(client):
     response = client.post(
-        "/process",
-        json={
-            "text": "Show my expenses and how much I spent",
-            "user_id": "u1",
-        },
+        "/process", content=_BODY_LIST_AND_AGG, headers=JSON_HEADERS
     )
 
     assert response.status_code == 400
@@ -12,11 +26,7 @@ def test_reject_list_and_aggregate_together(client):
 
 def test_reject_group_by_without_aggregate(client):
     response = client.post(
-        "/process",
-        json={
-            "text": "Show expenses grouped by category",
-            "user_id": "u1",
-        },
+        "/process", content=_BODY_GROUP_WITHOUT_AGG, headers=JSON_HEADERS
     )
 
     assert response.status_code == 400
@@ -24,21 +34,13 @@ def test_reject_group_by_without_aggregate(client):
 
 def test_reject_aggregate_with_columns(client):
     response = client.post(
-        "/process",
-        json={
-            "text": "How much did I spend, show category and date",
-            "user_id": "u1",
-        },
+        "/process", content=_BODY_AGG_WITH_COLUMNS, headers=JSON_HEADERS
     )
 
     assert response.status_code == 400
 def test_valid_simple_aggregate_still_works(client):
     response = client.post(
-        "/process",
-        json={
-            "text": "How much did I spend on food?",
-            "user_id": "u1",
-        },
+        "/process", content=_BODY_SIMPLE_AGG, headers=JSON_HEADERS
     )
 
     assert response.status_code == 200